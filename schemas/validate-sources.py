@@ -3,41 +3,96 @@
 FontGet Source Validation Tool
 
 Validates font source JSON files against the FontGet schema.
-Usage: python validate-sources.py <source-file.json>
+Usage: python validate-sources.py [--no-warnings] <source-file.json>
 """
 
+import functools
 import json
-import jsonschema
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
+
+# Prefer the Rust-backed validator; fall back to pure-Python jsonschema
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+# When installed, jsonschema also reports the errors of invalid files, so messages read the same on either backend
+try:
+    import jsonschema
+except ImportError:
+    if jsonschema_rs is None:
+        raise
+    jsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_schema(schema_bytes: bytes):
+    """Parse and compile a schema, shared by validators using the same file contents."""
+    schema = json.loads(schema_bytes)
+    error_validator = jsonschema.Draft7Validator(schema) if jsonschema is not None else None
+    if jsonschema_rs is not None:
+        # Match Draft7Validator defaults: "format" is an annotation only
+        validator = jsonschema_rs.validator_for(schema, validate_formats=False)
+    else:
+        validator = error_validator
+    return schema, validator, error_validator or validator
+
+
+def _load_json(content: bytes) -> Any:
+    """Parse a source file, reporting syntax errors with the json module's messages."""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Re-parse below so the error (or acceptance, e.g. NaN) matches the json module
+            pass
+    return json.loads(content.decode("utf-8"))
 
 
 class SourceValidator:
-    def __init__(self, schema_path: str = None):
+    def __init__(self, schema_path: str = None, check_warnings: bool = True):
         """Initialize validator with schema file."""
         if schema_path is None:
             schema_path = Path(__file__).parent / "font-source-schema.json"
+        self.schema_path = schema_path
+        # Warnings are informational; skipping them avoids a full walk of every font
+        self.check_warnings = check_warnings
         
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            self.schema = json.load(f)
-        
-        self.validator = jsonschema.Draft7Validator(self.schema)
+        with open(schema_path, 'rb') as f:
+            self.schema, self.validator, self.error_validator = _compile_schema(f.read())
     
-    def validate_file(self, file_path: str) -> Dict[str, Any]:
+    def validate_file(self, file_path: Union[str, os.PathLike]) -> Dict[str, Any]:
         """Validate a single source file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            data = _load_json(content)
             
-            errors = list(self.validator.iter_errors(data))
+            # Boolean check first; only collect and format errors for invalid files
+            if self.validator.is_valid(data):
+                return {
+                    "valid": True,
+                    "file": file_path,
+                    "errors": [],
+                    "warnings": self._check_warnings(data) if self.check_warnings else []
+                }
+            
+            errors = list(self.error_validator.iter_errors(data))
             
             return {
                 "valid": len(errors) == 0,
                 "file": file_path,
                 "errors": [self._format_error(error) for error in errors],
-                "warnings": self._check_warnings(data)
+                "warnings": self._check_warnings(data) if self.check_warnings else []
             }
         except json.JSONDecodeError as e:
             return {
@@ -56,14 +111,23 @@ class SourceValidator:
     
     def validate_directory(self, dir_path: str) -> List[Dict[str, Any]]:
         """Validate all JSON files in a directory."""
-        results = []
-        for file_path in Path(dir_path).glob("*.json"):
-            results.append(self.validate_file(str(file_path)))
-        return results
+        # Same files glob("*.json") would match, dotfiles included, without fnmatch
+        file_paths = [
+            str(file_path) for file_path in Path(dir_path).iterdir()
+            if file_path.name.endswith(".json")
+        ]
+        if len(file_paths) < 2:
+            return [self.validate_file(file_path) for file_path in file_paths]
+        
+        # Files are independent and validation is CPU-bound, so fan out across cores
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=(self.schema_path, self.check_warnings)) as executor:
+            return list(executor.map(_validate_one, file_paths, chunksize=8))
     
     def _format_error(self, error) -> str:
         """Format a validation error for display."""
-        path = " -> ".join(str(p) for p in error.absolute_path)
+        # jsonschema errors carry absolute_path; jsonschema_rs errors (no jsonschema installed) carry instance_path
+        error_path = error.absolute_path if hasattr(error, "absolute_path") else error.instance_path
+        path = " -> ".join(str(p) for p in error_path)
         return f"{path}: {error.message}"
     
     def _check_warnings(self, data: Dict[str, Any]) -> List[str]:
@@ -74,26 +138,40 @@ class SourceValidator:
         if not data.get("fonts"):
             warnings.append("No fonts found in source")
         
-        # Check for missing popularity data
+        # Count fonts missing popularity data and fonts with a single variant in one pass
         fonts = data.get("fonts", {})
-        fonts_without_popularity = [
-            font_id for font_id, font in fonts.items() 
-            if "popularity" not in font
-        ]
+        fonts_without_popularity = 0
+        single_variant_fonts = 0
+        for font in fonts.values():
+            if "popularity" not in font:
+                fonts_without_popularity += 1
+            variants = font.get("variants")
+            if variants is not None and len(variants) == 1:
+                single_variant_fonts += 1
+        
         if fonts_without_popularity:
-            warnings.append(f"Fonts without popularity data: {len(fonts_without_popularity)}")
+            warnings.append(f"Fonts without popularity data: {fonts_without_popularity}")
         
-        # Check for fonts with single variants
-        single_variant_fonts = [
-            font_id for font_id, font in fonts.items()
-            if len(font.get("variants", [])) == 1
-        ]
         if single_variant_fonts:
-            warnings.append(f"Fonts with only one variant: {len(single_variant_fonts)}")
+            warnings.append(f"Fonts with only one variant: {single_variant_fonts}")
         
         return warnings
 
 
+_worker_validator = None
+
+
+def _init_worker(schema_path: str, check_warnings: bool):
+    """Build one validator per worker process."""
+    global _worker_validator
+    _worker_validator = SourceValidator(schema_path, check_warnings)
+
+
+def _validate_one(file_path: Union[str, os.PathLike]) -> Dict[str, Any]:
+    """Validate a single file using the worker's validator."""
+    return _worker_validator.validate_file(file_path)
+
+
 def print_results(results: List[Dict[str, Any]]):
     """Print validation results in a readable format."""
     total_files = len(results)
@@ -123,15 +201,19 @@ def print_results(results: List[Dict[str, Any]]):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate-sources.py <source-file.json> [source-file2.json ...]")
-        print("       python validate-sources.py <directory>")
+    args = sys.argv[1:]
+    check_warnings = "--no-warnings" not in args
+    paths = [arg for arg in args if arg != "--no-warnings"]
+    
+    if not paths:
+        print("Usage: python validate-sources.py [--no-warnings] <source-file.json> [source-file2.json ...]")
+        print("       python validate-sources.py [--no-warnings] <directory>")
         sys.exit(1)
     
-    validator = SourceValidator()
+    validator = SourceValidator(check_warnings=check_warnings)
     results = []
     
-    for arg in sys.argv[1:]:
+    for arg in paths:
         if os.path.isfile(arg):
             results.append(validator.validate_file(arg))
         elif os.path.isdir(arg):
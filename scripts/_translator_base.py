@@ -0,0 +1,65 @@
+"""
+Shared base for FontGet source translators.
+
+Builds the FontGet source document around a translator's fonts and writes it
+to disk. Translator scripts run from scripts/, so they import this module
+directly.
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class BaseTranslator(ABC):
+    @abstractmethod
+    def translate(self) -> Dict[str, Any]:
+        """Fetch and transform the source, returning the document built by _source_data."""
+    
+    def _source_data(self, source_info: Dict[str, Any], fonts: Dict[str, Any]) -> Dict[str, Any]:
+        """Wrap transformed fonts in the FontGet source structure."""
+        return {
+            "source_info": {**source_info, "total_fonts": len(fonts)},
+            "fonts": fonts
+        }
+    
+    def write(self, source_data: Dict[str, Any], output_file: str) -> None:
+        """Write a source document as indented UTF-8 JSON, replacing output_file atomically."""
+        os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+        
+        # Write beside the target and swap it in, so a failed run never leaves a truncated source
+        tmp_file = output_file + ".tmp"
+        try:
+            if orjson is not None:
+                # Same bytes as json.dump(indent=2, ensure_ascii=False), serialized in C
+                with open(tmp_file, "wb") as f:
+                    f.write(orjson.dumps(source_data, option=orjson.OPT_INDENT_2))
+            else:
+                # json.dump issues many small writes; a larger buffer batches them
+                with open(tmp_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    json.dump(source_data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, output_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+    
+    def run(self, output_file: str) -> int:
+        """Translate the source and write it to output_file, returning an exit code."""
+        try:
+            source_data = self.translate()
+            self.write(source_data, output_file)
+            
+            print(f"Successfully generated {output_file} with {len(source_data['fonts'])} fonts")
+        
+        except Exception as e:
+            print(f"Error: {e}")
+            return 1
+        
+        return 0
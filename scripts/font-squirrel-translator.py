@@ -6,22 +6,109 @@ Fetches font data from Font Squirrel API and transforms it to FontGet format.
 Uses Font Squirrel's public API to get font information.
 """
 
-import json
 import os
+import shelve
+import sys
 import requests
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
 import re
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
 
+from _translator_base import BaseTranslator
 
-class FontSquirrelTranslator:
-    def __init__(self):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Font ID cleaning: disallowed characters become hyphens, runs of hyphens collapse
+_ID_BAD = re.compile(r'[^a-z0-9-]')
+_ID_DASHES = re.compile(r'-+')
+
+# Cheap shape check before datetime.fromisoformat: a date, then a time separator or the end
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}(?:[T ]|$)')
+
+
+class FontSquirrelTranslator(BaseTranslator):
+    # Weight keywords and numeric weights found in style names and filenames
+    _WEIGHT_TABLE = {
+        "thin": 100, "100": 100,
+        "extralight": 200, "ultralight": 200, "200": 200,
+        "light": 300, "300": 300,
+        "regular": 400, "normal": 400, "400": 400,
+        "medium": 500, "500": 500,
+        "semibold": 600, "demi": 600, "600": 600,
+        "extrabold": 800, "ultrabold": 800, "800": 800,
+        "bold": 700, "700": 700,
+        "black": 900, "heavy": 900, "900": 900,
+    }
+    # Longest keywords first so "extralight" wins over "light", "semibold" over "bold"
+    _WEIGHT_RE = re.compile("|".join(map(re.escape, sorted(_WEIGHT_TABLE, key=len, reverse=True))))
+    _STYLE_RE = re.compile("italic|oblique")
+    
+    # 10-category mapping with intelligent fallback
+    _CATEGORY_MAPPING = MappingProxyType({
+        # Core 10 categories
+        "Sans Serif": "Sans Serif",
+        "Serif": "Serif", 
+        "Slab Serif": "Slab Serif",
+        "Display": "Display",
+        "Monospace": "Monospace",
+        "Script": "Script",
+        "Handwriting": "Handwriting",
+        "Decorative": "Decorative",
+        "Symbol": "Symbol",
+        "Blackletter": "Blackletter",
+        
+        # Additional re-mappings to core 10 categories
+        "Typewriter": "Display",           # Typewriter → Display
+        "Novelty": "Decorative",           # Novelty → Decorative
+        "Comic": "Decorative",             # Comic → Decorative
+        "Dingbat": "Symbol",               # Dingbat → Symbol
+        "Handdrawn": "Handwriting",        # Handdrawn → Handwriting
+        "Calligraphic": "Script",          # Calligraphic → Script
+        "Cursive": "Script",               # Cursive → Script
+        "Programming": "Monospace",        # Programming → Monospace
+        "Retro": "Decorative",             # Retro → Decorative
+        "Grunge": "Decorative",            # Grunge → Decorative
+        "Pixel": "Decorative",             # Pixel → Decorative
+        "Stencil": "Decorative",           # Stencil → Decorative
+        "Monospaced": "Monospace",         # Monospaced → Monospace
+    })
+    _CATEGORY_MAPPING_LOWER = MappingProxyType({key.lower(): value for key, value in _CATEGORY_MAPPING.items()})
+    
+    # Display names for numeric weights
+    _WEIGHT_NAMES = MappingProxyType({
+        100: "Thin",
+        200: "Extra Light",
+        300: "Light",
+        400: "Regular",
+        500: "Medium",
+        600: "Semi Bold",
+        700: "Bold",
+        800: "Extra Bold",
+        900: "Black",
+    })
+    
+    def __init__(self, cache_dir: str = ".cache"):
         """Initialize translator."""
         self.base_url = "https://www.fontsquirrel.com/api"
         self.fontlist_url = f"{self.base_url}/fontlist/all"
         self.familyinfo_url = f"{self.base_url}/familyinfo"
         
-        # No category mapping needed - use direct categories
+        # familyinfo responses are cached in memory and on disk, keyed by family urlname
+        self.details_cache_path = os.path.join(cache_dir, "fsq_details")
+        self._details_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Reference time for recency scoring, captured once per translate() run
+        self._now: Optional[datetime] = None
+        
+        # Reuse pooled keep-alive connections across API calls
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
     
     def _normalize_category(self, category: str) -> str:
         """Normalize category with comprehensive enum mapping and fallback."""
@@ -33,50 +120,15 @@ class FontSquirrelTranslator:
         words = cleaned.split()
         normalized = " ".join(word.capitalize() for word in words)
         
-        # 10-category mapping with intelligent fallback
-        category_mapping = {
-            # Core 10 categories
-            "Sans Serif": "Sans Serif",
-            "Serif": "Serif", 
-            "Slab Serif": "Slab Serif",
-            "Display": "Display",
-            "Monospace": "Monospace",
-            "Script": "Script",
-            "Handwriting": "Handwriting",
-            "Decorative": "Decorative",
-            "Symbol": "Symbol",
-            "Blackletter": "Blackletter",
-            
-            # Additional re-mappings to core 10 categories
-            "Typewriter": "Display",           # Typewriter → Display
-            "Novelty": "Decorative",           # Novelty → Decorative
-            "Comic": "Decorative",             # Comic → Decorative
-            "Dingbat": "Symbol",               # Dingbat → Symbol
-            "Handdrawn": "Handwriting",        # Handdrawn → Handwriting
-            "Calligraphic": "Script",          # Calligraphic → Script
-            "Cursive": "Script",               # Cursive → Script
-            "Programming": "Monospace",        # Programming → Monospace
-            "Retro": "Decorative",             # Retro → Decorative
-            "Grunge": "Decorative",            # Grunge → Decorative
-            "Pixel": "Decorative",             # Pixel → Decorative
-            "Stencil": "Decorative",           # Stencil → Decorative
-            "Monospaced": "Monospace",         # Monospaced → Monospace
-            "Cursive": "Script",               # Cursive → Script
-        }
-        
-        # Check for exact match after normalization
-        if normalized in category_mapping:
-            return category_mapping[normalized]
-        
-        # Check for case-insensitive match
-        normalized_lower = normalized.lower()
-        for key, value in category_mapping.items():
-            if key.lower() == normalized_lower:
-                return value
+        # Case-insensitive lookup; exact matches resolve to the same value
+        mapped = self._CATEGORY_MAPPING_LOWER.get(normalized.lower())
+        if mapped:
+            return mapped
         
         # Fallback: return normalized (title case) for unknown categories
         # This allows custom sources to add new categories like "Graffiti", "Halloween", etc.
-        return normalized
+        # Interned because the same few classifications repeat across many fonts
+        return sys.intern(normalized)
     
     def _map_category(self, classification: str) -> str:
         """Return normalized classification, with fallback to 'Other'."""
@@ -89,19 +141,65 @@ class FontSquirrelTranslator:
     
     def fetch_fonts(self) -> List[Dict[str, Any]]:
         """Fetch all fonts from Font Squirrel API."""
-        response = requests.get(self.fontlist_url)
+        response = self.session.get(self.fontlist_url)
         response.raise_for_status()
+        return self._parse_json(response)
+    
+    def _parse_json(self, response: requests.Response) -> Any:
+        """Parse a JSON response body, using orjson when available."""
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
     
     def fetch_font_details(self, font_urlname: str) -> Dict[str, Any]:
         """Fetch detailed information for a specific font using familyinfo API."""
+        if font_urlname in self._details_cache:
+            return self._details_cache[font_urlname]
+        
+        os.makedirs(os.path.dirname(self.details_cache_path), exist_ok=True)
+        with shelve.open(self.details_cache_path) as disk_cache:
+            if font_urlname in disk_cache:
+                details = disk_cache[font_urlname]
+            else:
+                details = self._request_font_details(font_urlname)
+                # Only persist successful lookups so failures are retried next run
+                if details:
+                    disk_cache[font_urlname] = details
+        
+        self._details_cache[font_urlname] = details
+        return details
+    
+    def fetch_all_font_details(self, font_urlnames: List[str], max_workers: int = 16) -> None:
+        """Prefetch familyinfo for many fonts, requesting cache misses concurrently."""
+        os.makedirs(os.path.dirname(self.details_cache_path), exist_ok=True)
+        with shelve.open(self.details_cache_path) as disk_cache:
+            missing = []
+            for font_urlname in font_urlnames:
+                if font_urlname in self._details_cache:
+                    continue
+                if font_urlname in disk_cache:
+                    self._details_cache[font_urlname] = disk_cache[font_urlname]
+                else:
+                    missing.append(font_urlname)
+            
+            # Only the HTTP requests run in threads; shelve is not thread-safe
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for font_urlname, details in zip(missing, executor.map(self._request_font_details, missing)):
+                    self._details_cache[font_urlname] = details
+                    if details:
+                        disk_cache[font_urlname] = details
+    
+    def _request_font_details(self, font_urlname: str) -> Dict[str, Any]:
+        """Request familyinfo for a font from the Font Squirrel API."""
         try:
-            response = requests.get(f"{self.familyinfo_url}/{font_urlname}", timeout=10)
+            response = self.session.get(f"{self.familyinfo_url}/{font_urlname}", timeout=10)
             response.raise_for_status()
             
             # Check if response is valid JSON
-            if response.text.strip():
-                return response.json()
+            if response.content.strip():
+                details = self._parse_json(response)
+                # familyinfo returns a list of font files; keep the shape the transforms expect
+                return {"font_files": details} if isinstance(details, list) else details
             else:
                 return {}
         except Exception as e:
@@ -117,19 +215,18 @@ class FontSquirrelTranslator:
         if not font_name or not font_urlname:
             return None
         
-        # Skip detailed font information for now - just use basic data
-        details = {}
+        # Detailed font information is only used when translate() prefetched it
+        details = self._details_cache.get(font_urlname) or {}
         
         # Extract basic info
         family = font_name
-        font_get_id = font_name.lower().replace(' ', '-')
+        font_page_url = f"https://www.fontsquirrel.com/fonts/{font_urlname}"
         
         # Transform categories from classification
         categories = []
-        if "classification" in font_data:
-            classification = font_data["classification"]
-            mapped_category = self._map_category(classification)
-            categories.append(mapped_category)
+        classification = font_data.get("classification")
+        if classification is not None:
+            categories.append(self._map_category(classification))
         
         # Extract license information
         license_info = self._extract_license(font_data, details)
@@ -138,7 +235,7 @@ class FontSquirrelTranslator:
         variants = self._transform_variants(font_data, details)
         
         # Calculate popularity score
-        popularity = self._calculate_popularity(font_data, details)
+        popularity = self._calculate_popularity(font_data, details, self._now)
         
         # Extract tags
         tags = self._extract_tags(font_data, details)
@@ -156,8 +253,8 @@ class FontSquirrelTranslator:
             "tags": tags,
             "popularity": popularity,
             "last_modified": font_data.get("date_added", ""),
-            "metadata_url": f"https://www.fontsquirrel.com/fonts/{font_urlname}",
-            "source_url": f"https://www.fontsquirrel.com/fonts/{font_urlname}",
+            "metadata_url": font_page_url,
+            "source_url": font_page_url,
             "variants": variants,
             "unicode_ranges": self._extract_unicode_ranges(font_data, details),
             "languages": self._extract_languages(font_data, details),
@@ -224,10 +321,7 @@ class FontSquirrelTranslator:
             return None
         
         # Extract weight and style from filename or style_name
-        if style_name:
-            weight, style = self._parse_weight_style_from_name(style_name)
-        else:
-            weight, style = self._parse_weight_style(filename)
+        weight, style = self._parse_weight_style(style_name or filename)
         
         # Determine file format
         file_format = "ttf"  # Default
@@ -254,89 +348,22 @@ class FontSquirrelTranslator:
             }
         }
     
-    def _parse_weight_style(self, filename: str) -> tuple[int, str]:
-        """Parse weight and style from filename."""
-        filename_lower = filename.lower()
+    def _parse_weight_style(self, text: str) -> tuple[int, str]:
+        """Parse weight and style from a filename or style name."""
+        text_lower = text.lower()
         
         # Determine style
-        if "italic" in filename_lower or "oblique" in filename_lower:
-            style = "italic"
-        else:
-            style = "normal"
-        
-        # Determine weight
-        if "thin" in filename_lower or "100" in filename:
-            weight = 100
-        elif "extralight" in filename_lower or "ultralight" in filename_lower or "200" in filename:
-            weight = 200
-        elif "light" in filename_lower or "300" in filename:
-            weight = 300
-        elif "regular" in filename_lower or "normal" in filename_lower or "400" in filename:
-            weight = 400
-        elif "medium" in filename_lower or "500" in filename:
-            weight = 500
-        elif "semibold" in filename_lower or "demi" in filename_lower or "600" in filename:
-            weight = 600
-        elif "bold" in filename_lower or "700" in filename:
-            weight = 700
-        elif "extrabold" in filename_lower or "ultrabold" in filename_lower or "800" in filename:
-            weight = 800
-        elif "black" in filename_lower or "heavy" in filename_lower or "900" in filename:
-            weight = 900
-        else:
-            weight = 400  # Default
-        
-        return weight, style
-    
-    def _parse_weight_style_from_name(self, style_name: str) -> tuple[int, str]:
-        """Parse weight and style from style name."""
-        style_lower = style_name.lower()
+        style = "italic" if self._STYLE_RE.search(text_lower) else "normal"
         
-        # Determine style
-        if "italic" in style_lower or "oblique" in style_lower:
-            style = "italic"
-        else:
-            style = "normal"
-        
-        # Determine weight
-        if "thin" in style_lower or "100" in style_name:
-            weight = 100
-        elif "extralight" in style_lower or "ultralight" in style_lower or "200" in style_name:
-            weight = 200
-        elif "light" in style_lower or "300" in style_name:
-            weight = 300
-        elif "regular" in style_lower or "normal" in style_lower or "400" in style_name:
-            weight = 400
-        elif "medium" in style_lower or "500" in style_name:
-            weight = 500
-        elif "semibold" in style_lower or "demi" in style_lower or "600" in style_name:
-            weight = 600
-        elif "bold" in style_lower or "700" in style_name:
-            weight = 700
-        elif "extrabold" in style_lower or "ultrabold" in style_lower or "800" in style_name:
-            weight = 800
-        elif "black" in style_lower or "heavy" in style_lower or "900" in style_name:
-            weight = 900
-        else:
-            weight = 400  # Default
+        # Determine weight from the first weight keyword or number, default to 400
+        match = self._WEIGHT_RE.search(text_lower)
+        weight = self._WEIGHT_TABLE[match.group(0)] if match else 400
         
         return weight, style
     
     def _generate_variant_name(self, family_name: str, weight: int, style: str) -> str:
         """Generate variant name."""
-        weight_names = {
-            100: "Thin",
-            200: "Extra Light", 
-            300: "Light",
-            400: "Regular",
-            500: "Medium",
-            600: "Semi Bold",
-            700: "Bold",
-            800: "Extra Bold",
-            900: "Black"
-        }
-        
-        weight_name = weight_names.get(weight, str(weight))
+        weight_name = self._WEIGHT_NAMES.get(weight, str(weight))
         style_name = "Italic" if style == "italic" else ""
         
         if style_name:
@@ -344,7 +371,7 @@ class FontSquirrelTranslator:
         else:
             return f"{family_name} {weight_name}"
     
-    def _calculate_popularity(self, font_data: Dict[str, Any], details: Dict[str, Any]) -> int:
+    def _calculate_popularity(self, font_data: Dict[str, Any], details: Dict[str, Any], now: Optional[datetime] = None) -> int:
         """Calculate popularity score."""
         score = 50  # Base score
         
@@ -361,39 +388,47 @@ class FontSquirrelTranslator:
             score += min(len(details["font_files"]) * 5, 20)
         
         # Bonus for being recently added
-        if font_data.get("date_added"):
+        date_added = font_data.get("date_added")
+        if isinstance(date_added, str) and _ISO_DATE_RE.match(date_added):
             try:
-                date_added = datetime.fromisoformat(font_data["date_added"].replace("Z", "+00:00"))
-                days_old = (datetime.now() - date_added).days
+                date_added = datetime.fromisoformat(date_added.replace("Z", "+00:00"))
+            except ValueError:
+                # Right shape but not a real date/time, e.g. month 13
+                date_added = None
+            if date_added is not None:
+                if date_added.tzinfo is None:
+                    date_added = date_added.replace(tzinfo=timezone.utc)
+                days_old = ((now or datetime.now(timezone.utc)) - date_added).days
                 if days_old < 30:
                     score += 10
                 elif days_old < 90:
                     score += 5
-            except:
-                pass
         
         return min(score, 100)
     
     def _extract_tags(self, font_data: Dict[str, Any], details: Dict[str, Any]) -> List[str]:
         """Extract tags from font data."""
-        tags = []
+        # Dict keys dedupe while keeping insertion order for stable output
+        tags: Dict[str, None] = {}
         
         # Add classification as tag
-        if "classification" in font_data:
-            tags.append(font_data["classification"].lower().replace(" ", "-"))
+        classification = font_data.get("classification")
+        if classification is not None:
+            tags[sys.intern(classification.lower().replace(" ", "-"))] = None
         
         # Add style tags
         if font_data.get("designer"):
-            tags.append("designer-font")
+            tags["designer-font"] = None
         
         if font_data.get("foundry"):
-            tags.append("foundry-font")
+            tags["foundry-font"] = None
         
         # Add from details if available
-        if details and details.get("tags"):
-            tags.extend(details["tags"])
+        detail_tags = details.get("tags") if details else None
+        if detail_tags:
+            tags.update(dict.fromkeys(sys.intern(tag) for tag in detail_tags if isinstance(tag, str)))
         
-        return list(set(tags))  # Remove duplicates
+        return list(tags)
     
     def _extract_unicode_ranges(self, font_data: Dict[str, Any], details: Dict[str, Any]) -> List[str]:
         """Extract Unicode ranges."""
@@ -407,10 +442,11 @@ class FontSquirrelTranslator:
         # Return common languages
         return ["Latin", "Latin Extended"]
     
-    def translate(self, limit: int = None) -> Dict[str, Any]:
+    def translate(self, limit: int = None, fetch_details: bool = False) -> Dict[str, Any]:
         """Main translation function."""
         print("Fetching fonts from Font Squirrel API...")
         raw_data = self.fetch_fonts()
+        self._now = datetime.now(timezone.utc)
         
         print(f"Found {len(raw_data)} fonts")
         
@@ -419,6 +455,10 @@ class FontSquirrelTranslator:
             raw_data = raw_data[:limit]
             print(f"Processing first {limit} fonts for testing")
         
+        if fetch_details:
+            print("Fetching font details from Font Squirrel API...")
+            self.fetch_all_font_details([f["family_urlname"] for f in raw_data if f.get("family_urlname")])
+        
         # Transform fonts
         fonts = {}
         for font_data in raw_data:
@@ -426,9 +466,7 @@ class FontSquirrelTranslator:
                 transformed = self.transform_font(font_data)
                 if transformed:
                     # Clean font name for ID: lowercase, replace spaces/special chars with hyphens
-                    clean_name = re.sub(r'[^a-z0-9-]', '-', font_data['family_name'].lower())
-                    clean_name = re.sub(r'-+', '-', clean_name).strip('-')
-                    font_id = clean_name
+                    font_id = _ID_DASHES.sub('-', _ID_BAD.sub('-', font_data['family_name'].lower())).strip('-')
                     fonts[font_id] = transformed
             except Exception as e:
                 print(f"Warning: Failed to transform font {font_data.get('family_name', 'unknown')}: {e}")
@@ -437,43 +475,19 @@ class FontSquirrelTranslator:
         print(f"Successfully transformed {len(fonts)} fonts")
         
         # Create source structure
-        source_data = {
-            "source_info": {
-                "name": "Font Squirrel",
-                "description": "Free fonts from Font Squirrel",
-                "url": "https://www.fontsquirrel.com",
-                "api_endpoint": "https://www.fontsquirrel.com/api/fontlist/all",
-                "version": "1.0",
-                "last_updated": datetime.utcnow().isoformat() + "Z",
-                "total_fonts": len(fonts)
-            },
-            "fonts": fonts
-        }
-        
-        return source_data
+        return self._source_data({
+            "name": "Font Squirrel",
+            "description": "Free fonts from Font Squirrel",
+            "url": "https://www.fontsquirrel.com",
+            "api_endpoint": "https://www.fontsquirrel.com/api/fontlist/all",
+            "version": "1.0",
+            "last_updated": self._now.isoformat().replace("+00:00", "Z")
+        }, fonts)
 
 
 def main():
     """Main function."""
-    try:
-        translator = FontSquirrelTranslator()
-        # Process all available fonts
-        source_data = translator.translate()
-        
-        # Write to file
-        output_file = "sources/font-squirrel.json"
-        os.makedirs("sources", exist_ok=True)
-        
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(source_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"Successfully generated {output_file} with {len(source_data['fonts'])} fonts")
-        
-    except Exception as e:
-        print(f"Error: {e}")
-        return 1
-    
-    return 0
+    return FontSquirrelTranslator().run("sources/font-squirrel.json")
 
 
 if __name__ == "__main__":
@@ -4,18 +4,149 @@ Google Fonts API Translator for FontGet
 
 Fetches font data from Google Fonts API and transforms it to FontGet format.
 Requires GOOGLE_FONTS_API_KEY environment variable.
+Usage: python google-fonts-translator.py [--strict-license]
+
+By default every family is recorded as OFL; --strict-license reads each
+family's license from its METADATA.pb file instead.
+
+Pure Python apart from optional accelerators, so it also runs under PyPy
+(pypy3 scripts/google-fonts-translator.py); where orjson is unavailable the
+stdlib json module is used instead.
 """
 
 import json
 import os
+import shelve
+import sys
 import requests
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _translator_base import BaseTranslator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Font ID cleaning: each run of disallowed characters (hyphens included) becomes one hyphen
+_ID_RE = re.compile(r'[^a-z0-9]+')
+
+# The license line in a METADATA.pb file, matched on the raw response bytes,
+# and how much of the file to read looking for it
+_LICENSE_RE = re.compile(rb'^\s*license:\s*"([^"]+)"', re.M)
+_LICENSE_HEAD_BYTES = 4096
+
+# 10-category mapping with intelligent fallback
+_CATEGORY_MAPPING = MappingProxyType({
+    # Core 10 categories
+    "Sans Serif": "Sans Serif",
+    "Serif": "Serif", 
+    "Slab Serif": "Slab Serif",
+    "Display": "Display",
+    "Monospace": "Monospace",
+    "Script": "Script",
+    "Handwriting": "Handwriting",
+    "Decorative": "Decorative",
+    "Symbol": "Symbol",
+    "Blackletter": "Blackletter",
+
+    #Additional re-mappings to core 10 categories
+    "Typewriter": "Display",           # Typewriter → Display
+    "Novelty": "Decorative",           # Novelty → Decorative
+    "Comic": "Decorative",             # Comic → Decorative
+    "Dingbat": "Symbol",               # Dingbat → Symbol
+    "Handdrawn": "Handwriting",        # Handdrawn → Handwriting
+    "Calligraphic": "Script",          # Calligraphic → Script
+    "Cursive": "Script",               # Cursive → Script
+    "Programming": "Monospace",        # Programming → Monospace
+    "Retro": "Decorative",             # Retro → Decorative
+    "Grunge": "Decorative",            # Grunge → Decorative
+    "Pixel": "Decorative",             # Pixel → Decorative
+    "Stencil": "Decorative",           # Stencil → Decorative
+    "Monospaced": "Monospace",         # Monospaced → Monospace
+})
+_CATEGORY_MAPPING_LOWER = MappingProxyType({key.lower(): value for key, value in _CATEGORY_MAPPING.items()})
+
+_WEIGHT_NAMES = MappingProxyType({
+    100: "Thin",
+    200: "Extra Light",
+    300: "Light",
+    400: "Regular",
+    500: "Medium",
+    600: "Semi Bold",
+    700: "Bold",
+    800: "Extra Bold",
+    900: "Black"
+})
+
+# Common Unicode ranges for the subsets, in output order
+_SUBSET_RANGES = (
+    ("latin", "U+0000-00FF"),
+    ("latin-ext", "U+0100-017F"),
+    ("cyrillic", "U+0400-04FF"),
+    ("greek", "U+0370-03FF"),
+)
+
+_SUBSET_LANGUAGES = MappingProxyType({
+    "latin": "Latin",
+    "latin-ext": "Latin Extended",
+    "cyrillic": "Cyrillic",
+    "cyrillic-ext": "Cyrillic Extended",
+    "greek": "Greek",
+    "greek-ext": "Greek Extended",
+    "vietnamese": "Vietnamese",
+    "arabic": "Arabic",
+    "devanagari": "Devanagari",
+    "hebrew": "Hebrew",
+    "thai": "Thai",
+    "chinese-simplified": "Chinese Simplified",
+    "chinese-traditional": "Chinese Traditional",
+    "japanese": "Japanese",
+    "korean": "Korean"
+})
+
+# (weight, style, name suffix) for the standard variant keys
+_VARIANT_TABLE = MappingProxyType({
+    "regular": (400, "normal", "Regular"),
+    "italic": (400, "italic", "Italic"),
+    **{str(weight): (weight, "normal", name) for weight, name in _WEIGHT_NAMES.items()},
+    **{f"{weight}italic": (weight, "italic", f"{name} Italic") for weight, name in _WEIGHT_NAMES.items()},
+})
+
 
+def _make_font_id(family_lower: str) -> str:
+    """Clean an already-lowercased family name into a font ID: special chars to single hyphens."""
+    return _ID_RE.sub('-', family_lower).strip('-')
 
-class GoogleFontsTranslator:
-    def __init__(self, api_key: Optional[str] = None):
+
+def _is_well_formed(font_data: Any) -> bool:
+    """Check that every field transform_font reads has the type it expects."""
+    if not isinstance(font_data, dict) or not isinstance(font_data.get("family"), str):
+        return False
+    if "category" in font_data and not isinstance(font_data["category"], str):
+        return False
+    
+    variants = font_data.get("variants", [])
+    if not isinstance(variants, list) or not all(isinstance(variant, str) for variant in variants):
+        return False
+    
+    files = font_data.get("files", {})
+    if not isinstance(files, dict) or not all(isinstance(url, str) for url in files.values()):
+        return False
+    
+    subsets = font_data.get("subsets", [])
+    return isinstance(subsets, list) and all(isinstance(subset, str) for subset in subsets)
+
+
+class GoogleFontsTranslator(BaseTranslator):
+    def __init__(self, api_key: Optional[str] = None, fetch_licenses: bool = False, cache_dir: str = ".cache"):
         """Initialize translator with API key."""
         # Hardcoded for local testing
         self.api_key = api_key or os.getenv("GOOGLE_FONTS_API_KEY")
@@ -23,6 +154,21 @@ class GoogleFontsTranslator:
         
         if not self.api_key:
             raise ValueError("Google Fonts API key is required. Set GOOGLE_FONTS_API_KEY environment variable.")
+        
+        # METADATA.pb license lookups, keyed by family, so each family is fetched once
+        self.fetch_licenses = fetch_licenses
+        self._license_cache: Dict[str, str] = {}
+        
+        # Last webfonts response and its validators on disk, for conditional GETs
+        self.fonts_cache_path = os.path.join(cache_dir, "gfonts_webfonts")
+        # Parsed licenses with their METADATA.pb ETags, keyed by family
+        self.licenses_cache_path = os.path.join(cache_dir, "gfonts_licenses")
+        
+        # Pooled keep-alive connections shared by the API request and the license fetch threads;
+        # transient connection errors and 429/5xx responses are retried with backoff
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries))
     
     def _normalize_category(self, category: str) -> str:
         """Normalize category with comprehensive enum mapping and fallback."""
@@ -34,46 +180,10 @@ class GoogleFontsTranslator:
         words = cleaned.split()
         normalized = " ".join(word.capitalize() for word in words)
         
-        # 10-category mapping with intelligent fallback
-        category_mapping = {
-            # Core 10 categories
-            "Sans Serif": "Sans Serif",
-            "Serif": "Serif", 
-            "Slab Serif": "Slab Serif",
-            "Display": "Display",
-            "Monospace": "Monospace",
-            "Script": "Script",
-            "Handwriting": "Handwriting",
-            "Decorative": "Decorative",
-            "Symbol": "Symbol",
-            "Blackletter": "Blackletter",
-            
-            #Additional re-mappings to core 10 categories
-            "Typewriter": "Display",           # Typewriter → Display
-            "Novelty": "Decorative",           # Novelty → Decorative
-            "Comic": "Decorative",             # Comic → Decorative
-            "Dingbat": "Symbol",               # Dingbat → Symbol
-            "Handdrawn": "Handwriting",        # Handdrawn → Handwriting
-            "Calligraphic": "Script",          # Calligraphic → Script
-            "Cursive": "Script",               # Cursive → Script
-            "Programming": "Monospace",        # Programming → Monospace
-            "Retro": "Decorative",             # Retro → Decorative
-            "Grunge": "Decorative",            # Grunge → Decorative
-            "Pixel": "Decorative",             # Pixel → Decorative
-            "Stencil": "Decorative",           # Stencil → Decorative
-            "Monospaced": "Monospace",         # Monospaced → Monospace
-            "Cursive": "Script",               # Cursive → Script
-        }
-        
-        # Check for exact match after normalization
-        if normalized in category_mapping:
-            return category_mapping[normalized]
-        
-        # Check for case-insensitive match
-        normalized_lower = normalized.lower()
-        for key, value in category_mapping.items():
-            if key.lower() == normalized_lower:
-                return value
+        # Case-insensitive lookup; exact matches resolve to the same value
+        mapped = _CATEGORY_MAPPING_LOWER.get(normalized.lower())
+        if mapped:
+            return mapped
         
         # Fallback: return normalized (title case) for unknown categories
         # This allows custom sources to add new categories like "Graffiti", "Halloween", etc.
@@ -86,25 +196,55 @@ class GoogleFontsTranslator:
             "sort": "popularity"  # Sort by popularity for better user experience
         }
         
-        response = requests.get(self.base_url, params=params)
-        response.raise_for_status()
-        return response.json()
+        os.makedirs(os.path.dirname(self.fonts_cache_path), exist_ok=True)
+        with shelve.open(self.fonts_cache_path) as disk_cache:
+            cached = disk_cache.get("webfonts")
+            
+            # Revalidate the previous response; the catalogue changes rarely between runs
+            headers = {}
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            
+            response = self.session.get(self.base_url, params=params, headers=headers)
+            if response.status_code == 304 and cached:
+                content = cached["body"]
+            else:
+                response.raise_for_status()
+                content = response.content
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                # Without a validator the body could never be reused, so don't store it
+                if etag or last_modified:
+                    disk_cache["webfonts"] = {"etag": etag, "last_modified": last_modified, "body": content}
+                elif cached:
+                    del disk_cache["webfonts"]
+        
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
     
-    def transform_font(self, font_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Transform Google Fonts data to FontGet format."""
-        # Extract basic info
+    def transform_font(self, font_data: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Transform Google Fonts data to FontGet format, returning (font_id, font)."""
+        # Extract basic info once into locals
         family = font_data["family"]
-        # Clean font name for ID: lowercase, replace spaces/special chars with hyphens
-        clean_name = re.sub(r'[^a-z0-9-]', '-', family.lower())
-        clean_name = re.sub(r'-+', '-', clean_name).strip('-')
-        font_id = clean_name
+        family_lower = family.lower()
+        family_slug = family_lower.replace(' ', '')
+        family_plus = family.replace(' ', '+')
+        designer = font_data.get("designer", "")
+        version = font_data.get("version", "1.0")
+        description = font_data.get("description", "")
+        last_modified = font_data.get("lastModified", "")
+        font_id = _make_font_id(family_lower)
         
         # Transform variants
-        variants = []
-        for variant in font_data.get("variants", []):
-            variant_data = self._parse_variant(variant, family, font_data)
-            if variant_data:
-                variants.append(variant_data)
+        variants = [
+            variant_data
+            for variant_data in (self._parse_variant(variant, family, font_data) for variant in font_data.get("variants", []))
+            if variant_data
+        ]
         
         # Extract categories (normalize to title case)
         categories = []
@@ -116,21 +256,22 @@ class GoogleFontsTranslator:
         # Calculate popularity score (0-100)
         popularity = self._calculate_popularity(font_data)
         
-        return {
+        return font_id, {
             "name": family,
             "family": family,
-            "license": "OFL",  # Temporarily disabled license extraction for speed
-            "license_url": f"https://fonts.google.com/specimen/{family.replace(' ', '+')}/license",
-            "designer": font_data.get("designer", ""),
+            # METADATA.pb lookup is opt-in; nearly all Google Fonts are OFL
+            "license": self._extract_google_fonts_license(font_data) if self.fetch_licenses else "OFL",
+            "license_url": f"https://fonts.google.com/specimen/{family_plus}/license",
+            "designer": designer,
             "foundry": "Google",
-            "version": font_data.get("version", "1.0"),
-            "description": font_data.get("description", ""),
+            "version": version,
+            "description": description,
             "categories": categories,
             "tags": self._extract_tags(font_data),
             "popularity": popularity,
-            "last_modified": font_data.get("lastModified", ""),
-            "metadata_url": f"https://raw.githubusercontent.com/google/fonts/main/ofl/{family.lower().replace(' ', '')}/METADATA.pb",
-            "source_url": f"https://fonts.google.com/specimen/{family.replace(' ', '+')}",
+            "last_modified": last_modified,
+            "metadata_url": f"https://raw.githubusercontent.com/google/fonts/main/ofl/{family_slug}/METADATA.pb",
+            "source_url": f"https://fonts.google.com/specimen/{family_plus}",
             "variants": variants,
             "unicode_ranges": self._extract_unicode_ranges(font_data),
             "languages": self._extract_languages(font_data),
@@ -140,25 +281,22 @@ class GoogleFontsTranslator:
     def _parse_variant(self, variant: str, family: str, font_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Parse Google Fonts variant string into FontGet format."""
         # Google Fonts variants are like "regular", "700", "italic", "700italic"
-        if variant == "regular":
-            weight = 400
-            style = "normal"
-            name = f"{family} Regular"
-        elif variant == "italic":
-            weight = 400
-            style = "italic"
-            name = f"{family} Italic"
-        elif variant.isdigit():
+        entry = _VARIANT_TABLE.get(variant)
+        if entry is not None:
+            weight, style, label = entry
+        # Less common weights outside the table; isdecimal, since isdigit accepts "²", which int() rejects
+        elif variant.isdecimal():
             weight = int(variant)
             style = "normal"
-            name = f"{family} {self._weight_to_name(weight)}"
-        elif variant.endswith("italic"):
+            label = self._weight_to_name(weight)
+        elif variant.endswith("italic") and variant[:-6].isdecimal():
             weight = int(variant[:-6])
             style = "italic"
-            name = f"{family} {self._weight_to_name(weight)} Italic"
+            label = f"{self._weight_to_name(weight)} Italic"
         else:
             # Skip unsupported variants
             return None
+        name = f"{family} {label}"
         
         # Generate file URLs using actual Google Fonts API data
         files = self._generate_file_urls(font_data, variant)
@@ -173,18 +311,7 @@ class GoogleFontsTranslator:
     
     def _weight_to_name(self, weight: int) -> str:
         """Convert numeric weight to name."""
-        weight_names = {
-            100: "Thin",
-            200: "Extra Light",
-            300: "Light",
-            400: "Regular",
-            500: "Medium",
-            600: "Semi Bold",
-            700: "Bold",
-            800: "Extra Bold",
-            900: "Black"
-        }
-        return weight_names.get(weight, str(weight))
+        return _WEIGHT_NAMES.get(weight, str(weight))
     
     def _generate_file_urls(self, font_data: Dict[str, Any], variant: str) -> Dict[str, str]:
         """Generate file URLs for a font variant using actual Google Fonts API data."""
@@ -238,10 +365,18 @@ class GoogleFontsTranslator:
             tags.append(font_data["category"].lower().replace(" ", "-"))
         
         # Add style tags based on variants
-        variants = font_data.get("variants", [])
-        if any("italic" in v for v in variants):
+        # One pass over the variants, stopping once both tags are known
+        has_italic = has_bold = False
+        for v in font_data.get("variants", []):
+            if not has_italic and "italic" in v:
+                has_italic = True
+            elif not has_bold and v.isdecimal() and int(v) >= 700:
+                has_bold = True
+            if has_italic and has_bold:
+                break
+        if has_italic:
             tags.append("italic")
-        if any(v.isdigit() and int(v) >= 700 for v in variants):
+        if has_bold:
             tags.append("bold")
         
         return tags
@@ -251,138 +386,130 @@ class GoogleFontsTranslator:
         # Google Fonts doesn't provide detailed Unicode ranges in the API
         # We'll return common ranges based on subsets
         subsets = font_data.get("subsets", [])
-        ranges = []
-        
-        if "latin" in subsets:
-            ranges.append("U+0000-00FF")
-        if "latin-ext" in subsets:
-            ranges.append("U+0100-017F")
-        if "cyrillic" in subsets:
-            ranges.append("U+0400-04FF")
-        if "greek" in subsets:
-            ranges.append("U+0370-03FF")
-        
-        return ranges
+        return [unicode_range for subset, unicode_range in _SUBSET_RANGES if subset in subsets]
     
     def _extract_languages(self, font_data: Dict[str, Any]) -> List[str]:
         """Extract supported languages from font data."""
         subsets = font_data.get("subsets", [])
-        languages = []
-        
-        subset_languages = {
-            "latin": "Latin",
-            "latin-ext": "Latin Extended",
-            "cyrillic": "Cyrillic",
-            "cyrillic-ext": "Cyrillic Extended",
-            "greek": "Greek",
-            "greek-ext": "Greek Extended",
-            "vietnamese": "Vietnamese",
-            "arabic": "Arabic",
-            "devanagari": "Devanagari",
-            "hebrew": "Hebrew",
-            "thai": "Thai",
-            "chinese-simplified": "Chinese Simplified",
-            "chinese-traditional": "Chinese Traditional",
-            "japanese": "Japanese",
-            "korean": "Korean"
-        }
-        
-        for subset in subsets:
-            if subset in subset_languages:
-                languages.append(subset_languages[subset])
-        
-        return languages
+        return [_SUBSET_LANGUAGES[subset] for subset in subsets if subset in _SUBSET_LANGUAGES]
     
     def translate(self) -> Dict[str, Any]:
         """Main translation function."""
         print("Fetching fonts from Google Fonts API...")
         raw_data = self.fetch_fonts()
         
-        total_fonts = len(raw_data.get('items', []))
+        items = raw_data.get("items", [])
+        total_fonts = len(items)
         print(f"Found {total_fonts} fonts")
         
+        # Entries missing a family name or carrying mistyped fields can't be transformed; skip them up front
+        well_formed = [font_data for font_data in items if _is_well_formed(font_data)]
+        skipped = total_fonts - len(well_formed)
+        
+        if self.fetch_licenses:
+            print("Fetching licenses from METADATA.pb files...")
+            self._prefetch_licenses([f["family"] for f in well_formed])
+        
         # Transform fonts
         fonts = {}
-        for i, font_data in enumerate(raw_data.get("items", []), 1):
-            try:
-                if i % 50 == 0 or i == 1:  # Log every 50 fonts
-                    print(f"Processing font {i}/{total_fonts}: {font_data.get('family', 'Unknown')}")
-                
-                transformed = self.transform_font(font_data)
-                # Clean font name for ID: lowercase, replace spaces/special chars with hyphens
-                clean_name = re.sub(r'[^a-z0-9-]', '-', font_data['family'].lower())
-                clean_name = re.sub(r'-+', '-', clean_name).strip('-')
-                font_id = clean_name
-                fonts[font_id] = transformed
-            except Exception as e:
-                print(f"Warning: Failed to transform font {font_data.get('family', 'unknown')}: {e}")
-                continue
+        for i, font_data in enumerate(well_formed, 1):
+            if i % 50 == 0 or i == 1:  # Log every 50 fonts
+                print(f"Processing font {i}/{len(well_formed)}: {font_data['family']}")
+            
+            font_id, transformed = self.transform_font(font_data)
+            fonts[font_id] = transformed
         
-        # Create source structure
-        source_data = {
-            "source_info": {
-                "name": "Google Fonts",
-                "description": "Open source fonts from Google",
-                "url": "https://fonts.google.com",
-                "api_endpoint": "https://www.googleapis.com/webfonts/v1/webfonts",
-                "version": "1.0",
-                "last_updated": datetime.utcnow().isoformat() + "Z",
-                "total_fonts": len(fonts)
-            },
-            "fonts": fonts
-        }
+        if skipped:
+            print(f"Warning: Skipped {skipped} malformed fonts")
         
-        return source_data
+        # Create source structure
+        return self._source_data({
+            "name": "Google Fonts",
+            "description": "Open source fonts from Google",
+            "url": "https://fonts.google.com",
+            "api_endpoint": "https://www.googleapis.com/webfonts/v1/webfonts",
+            "version": "1.0",
+            "last_updated": datetime.utcnow().isoformat() + "Z"
+        }, fonts)
     
     def _extract_google_fonts_license(self, font_data: Dict[str, Any]) -> str:
         """Extract license from Google Fonts METADATA.pb file."""
         family = font_data['family']
         
+        if family not in self._license_cache:
+            self._prefetch_licenses([family])
+        return self._license_cache[family]
+    
+    def _prefetch_licenses(self, families: List[str], max_workers: int = 32) -> None:
+        """Fetch licenses for many families concurrently into the license cache."""
+        missing = [family for family in dict.fromkeys(families) if family not in self._license_cache]
+        
+        os.makedirs(os.path.dirname(self.licenses_cache_path), exist_ok=True)
+        with shelve.open(self.licenses_cache_path) as disk_cache:
+            cached = [disk_cache.get(family) for family in missing]
+            
+            # The lookups are I/O-bound HTTPS GETs, so threads overlap the network waits;
+            # only the requests run in threads, shelve is not thread-safe
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for family, entry in zip(missing, executor.map(self._fetch_google_fonts_license, missing, cached)):
+                    self._license_cache[family] = entry["license"]
+                    # Entries without a validator can't be revalidated, so they are refetched next run
+                    if entry["etag"]:
+                        disk_cache[family] = entry
+                    elif family in disk_cache:
+                        del disk_cache[family]
+    
+    def _fetch_google_fonts_license(self, family: str, cached: Optional[Dict[str, str]] = None) -> Dict[str, Optional[str]]:
+        """Fetch a family's license from its METADATA.pb file, revalidating a cached entry."""
         # Clean family name for URL
         family_clean = family.lower().replace(' ', '')
         
+        # The license line sits in the first few lines, so only request the head of the file
+        headers = {"Range": "bytes=0-2047"}
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+        
         # Try to fetch METADATA.pb file
         try:
             url = f"https://raw.githubusercontent.com/google/fonts/main/ofl/{family_clean}/METADATA.pb"
-            response = requests.get(url, timeout=3)  # Reduced timeout
-            
-            if response.status_code == 200:
-                content = response.text
-                # Extract license line
-                for line in content.split('\n'):
-                    if line.strip().startswith('license:'):
+            with self.session.get(url, headers=headers, stream=True, timeout=3) as response:  # Reduced timeout
+                # Unchanged since the license was cached
+                if response.status_code == 304 and cached:
+                    return cached
+                
+                # 206 for the requested range, 200 if the server sent the whole file anyway
+                if response.status_code in (200, 206):
+                    etag = response.headers.get("ETag")
+                    # Read until the license line is seen, in case the Range header was ignored
+                    head = bytearray()
+                    for chunk in response.iter_content(chunk_size=1024):
+                        head += chunk
                         # Extract license from: license: "OFL"
-                        license_match = line.split('"')
-                        if len(license_match) > 1:
-                            return license_match[1]  # Return "OFL"
+                        license_match = _LICENSE_RE.search(head)
+                        if license_match:
+                            return {"license": license_match.group(1).decode(), "etag": etag}
+                        if len(head) >= _LICENSE_HEAD_BYTES:
+                            break
+                    return {"license": "OFL", "etag": etag}
         except Exception as e:
             # Don't print warnings for every failed license fetch to reduce noise
             pass
         
         # Fallback: Most Google Fonts are OFL
-        return "OFL"
+        return {"license": "OFL", "etag": None}
 
 
 def main():
     """Main function."""
+    # Authoritative METADATA.pb license lookups are opt-in
+    strict_license = "--strict-license" in sys.argv[1:]
     try:
-        translator = GoogleFontsTranslator()
-        source_data = translator.translate()
-        
-        # Write to file
-        output_file = "sources/google-fonts.json"
-        os.makedirs("sources", exist_ok=True)
-        
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(source_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"Successfully generated {output_file} with {len(source_data['fonts'])} fonts")
-        
+        translator = GoogleFontsTranslator(fetch_licenses=strict_license)
     except Exception as e:
         print(f"Error: {e}")
         return 1
     
-    return 0
+    return translator.run("sources/google-fonts.json")
 
 
 if __name__ == "__main__":
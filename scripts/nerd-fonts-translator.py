@@ -6,20 +6,111 @@ Fetches font data from Nerd Fonts GitHub releases and transforms it to FontGet f
 Uses GitHub API to get release information and font files.
 """
 
-import json
-import os
+import functools
 import requests
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 import re
 
+from _translator_base import BaseTranslator
 
-class NerdFontsTranslator:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Font ID cleaning: each run of disallowed characters (hyphens included) becomes one hyphen
+_ID_RE = re.compile(r'[^a-z0-9]+')
+
+# "NerdFont"/"Nerd Font(s)" and version numbers, stripped from asset names
+_NERD_RE = re.compile(r'[Nn]erd\s*[Ff]ont[s]?')
+_VERSION_RE = re.compile(r'v?\d+\.\d+\.?\d*')
+
+# 10-category mapping with intelligent fallback
+_CATEGORY_MAPPING = MappingProxyType({
+    # Core 10 categories
+    "Sans Serif": "Sans Serif",
+    "Serif": "Serif", 
+    "Slab Serif": "Slab Serif",
+    "Display": "Display",
+    "Monospace": "Monospace",
+    "Script": "Script",
+    "Handwriting": "Handwriting",
+    "Decorative": "Decorative",
+    "Symbol": "Symbol",
+    "Blackletter": "Blackletter",
+
+    # Additional re-mappings to core 10 categories
+    "Typewriter": "Display",           # Typewriter → Display
+    "Novelty": "Decorative",           # Novelty → Decorative
+    "Comic": "Decorative",             # Comic → Decorative
+    "Dingbat": "Symbol",               # Dingbat → Symbol
+    "Handdrawn": "Handwriting",        # Handdrawn → Handwriting
+    "Calligraphic": "Script",          # Calligraphic → Script
+    "Cursive": "Script",               # Cursive → Script
+    "Programming": "Monospace",        # Programming → Monospace
+    "Retro": "Decorative",             # Retro → Decorative
+    "Grunge": "Decorative",            # Grunge → Decorative
+    "Pixel": "Decorative",             # Pixel → Decorative
+    "Stencil": "Decorative",           # Stencil → Decorative
+    "Monospaced": "Monospace",         # Monospaced → Monospace
+})
+_CATEGORY_MAPPING_LOWER = MappingProxyType({key.lower(): value for key, value in _CATEGORY_MAPPING.items()})
+
+# Popular programming fonts get higher scores
+_POPULAR_FONTS = MappingProxyType({
+    "Fira Code": 95,
+    "JetBrains Mono": 90,
+    "Cascadia Code": 85,
+    "Source Code Pro": 80,
+    "Hack": 75,
+    "Roboto Mono": 70,
+    "Ubuntu Mono": 65,
+    "DejaVu Sans Mono": 60,
+    "Mononoki": 55,
+    "Noto Sans Mono": 50,
+    "Space Mono": 45,
+    "Terminus": 40,
+    "Victor Mono": 35,
+    "Meslo": 30
+})
+
+
+def _make_font_id(family_lower: str) -> str:
+    """Clean an already-lowercased family name into a font ID: special chars to single hyphens."""
+    return _ID_RE.sub('-', family_lower).strip('-')
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_category(category: str) -> str:
+    """Normalize category with comprehensive enum mapping and fallback."""
+    if not category or not category.strip():
+        return "Other"
+    
+    # First normalize: replace hyphens/underscores with spaces, title case
+    cleaned = category.replace("-", " ").replace("_", " ").strip()
+    words = cleaned.split()
+    normalized = " ".join(word.capitalize() for word in words)
+    
+    # Case-insensitive lookup; exact matches resolve to the same value
+    mapped = _CATEGORY_MAPPING_LOWER.get(normalized.lower())
+    if mapped:
+        return mapped
+    
+    # Fallback: return normalized (title case) for unknown categories
+    # This allows custom sources to add new categories like "Graffiti", "Halloween", etc.
+    return normalized
+
+
+class NerdFontsTranslator(BaseTranslator):
     def __init__(self):
         """Initialize translator."""
         self.base_url = "https://api.github.com/repos/ryanoasis/nerd-fonts"
         self.releases_url = f"{self.base_url}/releases"
         self.contents_url = f"{self.base_url}/contents"
+        # Timestamp of the current translate() run, shared by every font it emits
+        self._now_iso: Optional[str] = None
         
         # Common Nerd Fonts patterns
         self.font_patterns = {
@@ -79,66 +170,21 @@ class NerdFontsTranslator:
             "VazirCode": "Vazir Code",
             "YaHeiConsolasHybrid": "YaHei Consolas Hybrid"
         }
-    
-    def _normalize_category(self, category: str) -> str:
-        """Normalize category with comprehensive enum mapping and fallback."""
-        if not category or not category.strip():
-            return "Other"
-        
-        # First normalize: replace hyphens/underscores with spaces, title case
-        cleaned = category.replace("-", " ").replace("_", " ").strip()
-        words = cleaned.split()
-        normalized = " ".join(word.capitalize() for word in words)
-        
-        # 10-category mapping with intelligent fallback
-        category_mapping = {
-            # Core 10 categories
-            "Sans Serif": "Sans Serif",
-            "Serif": "Serif", 
-            "Slab Serif": "Slab Serif",
-            "Display": "Display",
-            "Monospace": "Monospace",
-            "Script": "Script",
-            "Handwriting": "Handwriting",
-            "Decorative": "Decorative",
-            "Symbol": "Symbol",
-            "Blackletter": "Blackletter",
-            
-            # Additional re-mappings to core 10 categories
-            "Typewriter": "Display",           # Typewriter → Display
-            "Novelty": "Decorative",           # Novelty → Decorative
-            "Comic": "Decorative",             # Comic → Decorative
-            "Dingbat": "Symbol",               # Dingbat → Symbol
-            "Handdrawn": "Handwriting",        # Handdrawn → Handwriting
-            "Calligraphic": "Script",          # Calligraphic → Script
-            "Cursive": "Script",               # Cursive → Script
-            "Programming": "Monospace",        # Programming → Monospace
-            "Retro": "Decorative",             # Retro → Decorative
-            "Grunge": "Decorative",            # Grunge → Decorative
-            "Pixel": "Decorative",             # Pixel → Decorative
-            "Stencil": "Decorative",           # Stencil → Decorative
-            "Monospaced": "Monospace",         # Monospaced → Monospace
-            "Cursive": "Script",               # Cursive → Script
-        }
-        
-        # Check for exact match after normalization
-        if normalized in category_mapping:
-            return category_mapping[normalized]
         
-        # Check for case-insensitive match
-        normalized_lower = normalized.lower()
-        for key, value in category_mapping.items():
-            if key.lower() == normalized_lower:
-                return value
-        
-        # Fallback: return normalized (title case) for unknown categories
-        # This allows custom sources to add new categories like "Graffiti", "Halloween", etc.
-        return normalized
+        # One case-insensitive alternation over the patterns, longest first so that
+        # e.g. "InconsolataGo" wins over "Inconsolata"
+        self._pattern_names = {pattern.lower(): display_name for pattern, display_name in self.font_patterns.items()}
+        self._pattern_regex = re.compile(
+            "|".join(re.escape(pattern) for pattern in sorted(self.font_patterns, key=len, reverse=True)),
+            re.IGNORECASE,
+        )
     
     def fetch_releases(self) -> List[Dict[str, Any]]:
         """Fetch all releases from Nerd Fonts GitHub."""
         response = requests.get(self.releases_url)
         response.raise_for_status()
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
     
     def get_latest_release(self) -> Dict[str, Any]:
@@ -151,6 +197,7 @@ class NerdFontsTranslator:
     def extract_font_info_from_assets(self, assets: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Extract font information from release assets."""
         fonts = {}
+        now_iso = self._now_iso or datetime.utcnow().isoformat() + "Z"
         
         for asset in assets:
             name = asset["name"]
@@ -166,9 +213,7 @@ class NerdFontsTranslator:
                 continue
             
             # Clean font name for ID: lowercase, replace spaces/special chars with hyphens
-            clean_name = re.sub(r'[^a-z0-9-]', '-', font_name.lower())
-            clean_name = re.sub(r'-+', '-', clean_name).strip('-')
-            font_id = clean_name
+            font_id = _make_font_id(font_name.lower())
             
             if font_id not in fonts:
                 fonts[font_id] = {
@@ -180,10 +225,10 @@ class NerdFontsTranslator:
                     "foundry": "Nerd Fonts",
                     "version": "3.0.2",  # Current Nerd Fonts version
                     "description": f"Patched version of {font_name} with additional icon glyphs",
-                    "categories": [self._normalize_category("Nerd Font")],
+                    "categories": [_normalize_category("Nerd Font")],
                     "tags": ["nerd-fonts", "icons", "patched", "monospace", "programming"],
                     "popularity": self._calculate_popularity(font_name),
-                    "last_modified": datetime.utcnow().isoformat() + "Z",
+                    "last_modified": now_iso,
                     "metadata_url": "https://github.com/ryanoasis/nerd-fonts",
                     "source_url": f"https://github.com/ryanoasis/nerd-fonts/releases/latest",
                     "variants": [],
@@ -205,17 +250,13 @@ class NerdFontsTranslator:
         name = filename.replace('.zip', '').replace('.tar.xz', '')
         
         # Try to match known patterns
-        for pattern, display_name in self.font_patterns.items():
-            if pattern.lower() in name.lower():
-                return display_name
+        pattern_match = self._pattern_regex.search(name)
+        if pattern_match:
+            return self._pattern_names[pattern_match.group(0).lower()]
         
         # Try to extract from common patterns
-        # Remove "NerdFont" or "Nerd Font" from name
-        name = re.sub(r'[Nn]erd[Ff]ont[s]?', '', name)
-        name = re.sub(r'[Nn]erd\s*[Ff]ont[s]?', '', name)
-        
-        # Remove version numbers
-        name = re.sub(r'v?\d+\.\d+\.?\d*', '', name)
+        # Remove "NerdFont" or "Nerd Font" from name, then version numbers
+        name = _VERSION_RE.sub('', _NERD_RE.sub('', name))
         
         # Clean up and format
         name = name.replace('_', ' ').replace('-', ' ').strip()
@@ -248,28 +289,12 @@ class NerdFontsTranslator:
     
     def _calculate_popularity(self, font_name: str) -> int:
         """Calculate popularity score based on font name."""
-        # Popular programming fonts get higher scores
-        popular_fonts = {
-            "Fira Code": 95,
-            "JetBrains Mono": 90,
-            "Cascadia Code": 85,
-            "Source Code Pro": 80,
-            "Hack": 75,
-            "Roboto Mono": 70,
-            "Ubuntu Mono": 65,
-            "DejaVu Sans Mono": 60,
-            "Mononoki": 55,
-            "Noto Sans Mono": 50,
-            "Space Mono": 45,
-            "Terminus": 40,
-            "Victor Mono": 35,
-            "Meslo": 30
-        }
-        
-        return popular_fonts.get(font_name, 25)
+        return _POPULAR_FONTS.get(font_name, 25)
     
     def translate(self) -> Dict[str, Any]:
         """Main translation function."""
+        self._now_iso = datetime.utcnow().isoformat() + "Z"
+        
         print("Fetching Nerd Fonts release data...")
         latest_release = self.get_latest_release()
         
@@ -282,44 +307,19 @@ class NerdFontsTranslator:
         print(f"Extracted {len(fonts)} fonts")
         
         # Create source structure
-        source_data = {
-            "source_info": {
-                "name": "Nerd Fonts",
-                "description": "Patched fonts with additional icon glyphs for programming",
-                "url": "https://www.nerdfonts.com",
-                "api_endpoint": "https://api.github.com/repos/ryanoasis/nerd-fonts/releases",
-                "version": "1.0",
-                "last_updated": datetime.utcnow().isoformat() + "Z",
-                "total_fonts": len(fonts)
-            },
-            "fonts": fonts
-        }
-        
-        return source_data
+        return self._source_data({
+            "name": "Nerd Fonts",
+            "description": "Patched fonts with additional icon glyphs for programming",
+            "url": "https://www.nerdfonts.com",
+            "api_endpoint": "https://api.github.com/repos/ryanoasis/nerd-fonts/releases",
+            "version": "1.0",
+            "last_updated": self._now_iso
+        }, fonts)
 
 
 def main():
     """Main function."""
-    try:
-        translator = NerdFontsTranslator()
-        source_data = translator.translate()
-        
-        # Write to file
-        output_file = "sources/nerd-fonts.json"
-        os.makedirs("sources", exist_ok=True)
-        
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(source_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"Successfully generated {output_file} with {len(source_data['fonts'])} fonts")
-        
-    except Exception as e:
-        print(f"Error: {e}")
-        return 1
-    
-    return 0
-
-
+    return NerdFontsTranslator().run("sources/nerd-fonts.json")
 
 
 if __name__ == "__main__":
@@ -6,86 +6,103 @@ Fetches font data from Open Foundry dataset and transforms it to FontGet format.
 Data source: https://open-foundry.com/data/sheet.json
 """
 
-import json
-import os
+import functools
 import re
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
 
 import requests
 
-
-class OpenFoundryTranslator:
+from _translator_base import BaseTranslator
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+# Font ID cleaning: each run of disallowed characters (hyphens included) becomes one hyphen
+_ID_RE = re.compile(r"[^a-z0-9]+")
+
+# Styles that map to "italic"; matched case-insensitively without lowercasing each row
+_STYLE_ITALIC_RE = re.compile(r"italic|oblique", re.IGNORECASE)
+
+_WEIGHT_NAMES = MappingProxyType({
+	100: "Thin", 200: "Extra Light", 300: "Light", 400: "Regular",
+	500: "Medium", 600: "Semi Bold", 700: "Bold", 800: "Extra Bold", 900: "Black",
+})
+
+# Download link extensions that yield a variant: installable fonts and archives
+_FILE_EXTS = frozenset({"ttf", "otf", "zip", "tar.gz", "tar.xz"})
+
+# 10-category mapping with intelligent fallback
+_CATEGORY_MAPPING = MappingProxyType({
+	# Core 10 categories
+	"Sans Serif": "Sans Serif",
+	"Serif": "Serif", 
+	"Slab Serif": "Slab Serif",
+	"Display": "Display",
+	"Monospace": "Monospace",
+	"Script": "Script",
+	"Handwriting": "Handwriting",
+	"Decorative": "Decorative",
+	"Symbol": "Symbol",
+	"Blackletter": "Blackletter",
+
+	#Additional re-mappings to core 10 categories
+	"Typewriter": "Display",           # Typewriter → Display
+	"Novelty": "Decorative",           # Novelty → Decorative
+	"Comic": "Decorative",             # Comic → Decorative
+	"Dingbat": "Symbol",               # Dingbat → Symbol
+	"Handdrawn": "Handwriting",        # Handdrawn → Handwriting
+	"Calligraphic": "Script",          # Calligraphic → Script
+	"Cursive": "Script",               # Cursive → Script
+	"Programming": "Monospace",        # Programming → Monospace
+	"Retro": "Decorative",             # Retro → Decorative
+	"Grunge": "Decorative",            # Grunge → Decorative
+	"Pixel": "Decorative",             # Pixel → Decorative
+	"Stencil": "Decorative",           # Stencil → Decorative
+	"Monospaced": "Monospace",         # Monospaced → Monospace
+})
+_CATEGORY_MAPPING_LOWER = MappingProxyType({key.lower(): value for key, value in _CATEGORY_MAPPING.items()})
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_category(category: str) -> str:
+	"""Normalize category with comprehensive enum mapping and fallback."""
+	if not category or not category.strip():
+		return "Other"
+	
+	# First normalize: replace hyphens/underscores with spaces
+	words = category.replace("-", " ").replace("_", " ").split()
+	
+	# Case-insensitive lookup; exact matches resolve to the same value
+	mapped = _CATEGORY_MAPPING_LOWER.get(" ".join(words).lower())
+	if mapped:
+		return mapped
+	
+	# Fallback: return title case for unknown categories
+	# This allows custom sources to add new categories like "Graffiti", "Halloween", etc.
+	return " ".join(word.capitalize() for word in words)
+
+
+class OpenFoundryTranslator(BaseTranslator):
 	def __init__(self) -> None:
 		self.api_url = "https://open-foundry.com/data/sheet.json"
+		# Keep-alive session; requests already negotiates gzip/deflate (and br when brotli is installed)
+		self.session = requests.Session()
+		self.session.headers["Accept"] = "application/json"
 
 	def fetch(self) -> List[Dict[str, Any]]:
-		resp = requests.get(self.api_url, timeout=15)
+		resp = self.session.get(self.api_url, timeout=15)
 		resp.raise_for_status()
-		data = resp.json()
+		data = orjson.loads(resp.content) if orjson is not None else resp.json()
 		if not isinstance(data, list):
 			raise ValueError("Unexpected Open Foundry response shape")
 		return data
 
 	def _clean_id(self, value: str) -> str:
-		clean = re.sub(r"[^a-z0-9-]", "-", value.lower())
-		clean = re.sub(r"-+", "-", clean).strip("-")
-		return clean
-
-	def _normalize_category(self, category: str) -> str:
-		"""Normalize category with comprehensive enum mapping and fallback."""
-		if not category or not category.strip():
-			return "Other"
-		
-		# First normalize: replace hyphens/underscores with spaces, title case
-		cleaned = category.replace("-", " ").replace("_", " ").strip()
-		words = cleaned.split()
-		normalized = " ".join(word.capitalize() for word in words)
-		
-		# 10-category mapping with intelligent fallback
-		category_mapping = {
-			# Core 10 categories
-			"Sans Serif": "Sans Serif",
-			"Serif": "Serif", 
-			"Slab Serif": "Slab Serif",
-			"Display": "Display",
-			"Monospace": "Monospace",
-			"Script": "Script",
-			"Handwriting": "Handwriting",
-			"Decorative": "Decorative",
-			"Symbol": "Symbol",
-			"Blackletter": "Blackletter",
-			
-			#Additional re-mappings to core 10 categories
-			"Typewriter": "Display",           # Typewriter → Display
-			"Novelty": "Decorative",           # Novelty → Decorative
-			"Comic": "Decorative",             # Comic → Decorative
-			"Dingbat": "Symbol",               # Dingbat → Symbol
-			"Handdrawn": "Handwriting",        # Handdrawn → Handwriting
-			"Calligraphic": "Script",          # Calligraphic → Script
-			"Cursive": "Script",               # Cursive → Script
-			"Programming": "Monospace",        # Programming → Monospace
-			"Retro": "Decorative",             # Retro → Decorative
-			"Grunge": "Decorative",            # Grunge → Decorative
-			"Pixel": "Decorative",             # Pixel → Decorative
-			"Stencil": "Decorative",           # Stencil → Decorative
-			"Monospaced": "Monospace",         # Monospaced → Monospace
-			"Cursive": "Script",               # Cursive → Script
-		}
-		
-		# Check for exact match after normalization
-		if normalized in category_mapping:
-			return category_mapping[normalized]
-		
-		# Check for case-insensitive match
-		normalized_lower = normalized.lower()
-		for key, value in category_mapping.items():
-			if key.lower() == normalized_lower:
-				return value
-		
-		# Fallback: return normalized (title case) for unknown categories
-		# This allows custom sources to add new categories like "Graffiti", "Halloween", etc.
-		return normalized
+		return _ID_RE.sub("-", value.lower()).strip("-")
 
 	def _weight_from_info(self, weight: Any) -> int:
 		try:
@@ -98,42 +115,36 @@ class OpenFoundryTranslator:
 		return 400
 
 	def _style_from_info(self, style: str) -> str:
-		if not style:
-			return "normal"
-		style_l = style.lower()
-		if "italic" in style_l or "oblique" in style_l:
+		if style and _STYLE_ITALIC_RE.search(style):
 			return "italic"
 		return "normal"
 
 	def _build_variant(self, family: str, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-		weight = self._weight_from_info(row.get("info-weight"))
-		style = self._style_from_info(str(row.get("info-style", "")))
-		weight_names = {
-			100: "Thin", 200: "Extra Light", 300: "Light", 400: "Regular",
-			500: "Medium", 600: "Semi Bold", 700: "Bold", 800: "Extra Bold", 900: "Black",
-		}
-		name = f"{family} {weight_names.get(weight, str(weight))}"
-		if style == "italic":
-			name += " Italic"
-
 		files: Dict[str, str] = {}
 		dl = row.get("font-download-link", "")
 		if isinstance(dl, str) and dl:
-			if dl.endswith((".ttf", ".otf")):
-				files[dl.rsplit(".", 1)[-1].lower()] = dl
-			elif dl.endswith((".zip", ".tar.gz", ".tar.xz")):
-				# Provide archive as-is; CLI extracts
-				ext = dl.split(".")[-1].lower()
-				# Reconstruct full archive extension for tarballs
-				if dl.endswith(".tar.gz"):
-					ext = "tar.gz"
-				elif dl.endswith(".tar.xz"):
-					ext = "tar.xz"
+			# Classify the extension once; tarballs keep their full two-part extension
+			dl_l = dl.lower()
+			if dl_l.endswith(".tar.gz"):
+				ext = "tar.gz"
+			elif dl_l.endswith(".tar.xz"):
+				ext = "tar.xz"
+			else:
+				ext = dl_l.rpartition(".")[2]
+			# Font files directly, archives as-is; CLI extracts
+			if ext in _FILE_EXTS:
 				files[ext] = dl
 		# If no direct file, skip creating a variant (no installable or archive reference)
 		if not files:
 			return None
 
+		# Only rows with a usable link pay for parsing and naming
+		weight = self._weight_from_info(row.get("info-weight"))
+		style = self._style_from_info(str(row.get("info-style", "")))
+		name = f"{family} {_WEIGHT_NAMES.get(weight, str(weight))}"
+		if style == "italic":
+			name += " Italic"
+
 		return {
 			"name": name,
 			"weight": weight,
@@ -144,88 +155,76 @@ class OpenFoundryTranslator:
 
 	def translate(self) -> Dict[str, Any]:
 		rows = self.fetch()
-		# Group by family (font-name)
-		families: Dict[str, List[Dict[str, Any]]] = {}
+		# Group by family (font-name), building each family's deduplicated variants as rows arrive;
+		# the family's first row supplies its metadata
+		families: Dict[str, Tuple[Dict[str, Any], List[Dict[str, Any]], set]] = {}
+		build_variant = self._build_variant
 		for row in rows:
 			family = row.get("font-name")
 			if not family:
 				continue
-			families.setdefault(family, []).append(row)
+			if family not in families:
+				families[family] = (row, [], set())
+			_, variants, seen = families[family]
+			variant = build_variant(family, row)
+			if not variant:
+				continue
+			# _build_variant stores exactly one file, so its (ext, url) pair stands in for the whole map
+			key = (variant["weight"], variant["style"], next(iter(variant["files"].items())))
+			if key in seen:
+				continue
+			seen.add(key)
+			variants.append(variant)
 
+		# One timestamp for the whole run
+		now_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 		fonts: Dict[str, Any] = {}
-		for family, items in families.items():
-			font_id = self._clean_id(family)
-			# Build variants
-			variants: List[Dict[str, Any]] = []
-			seen = set()
-			for r in items:
-				variant = self._build_variant(family, r)
-				if not variant:
-					continue
-				key = (variant["weight"], variant["style"], tuple(sorted(variant["files"].items())))
-				if key in seen:
-					continue
-				seen.add(key)
-				variants.append(variant)
+		for family, (first, variants, _) in families.items():
 			if not variants:
 				# Skip families with no usable download links
 				continue
+			font_id = self._clean_id(family)
 
-			license_type = items[0].get("info-license", "Other")
-			license_url = items[0].get("info-license-link", "")
-			classification = items[0].get("info-classification")
+			license_type = first.get("info-license", "Other")
+			license_url = first.get("info-license-link", "")
+			classification = first.get("info-classification")
 			categories: List[str] = []
 			if classification:
-				categories = [self._normalize_category(classification)]
+				categories = [_normalize_category(classification)]
 
 			fonts[font_id] = {
 				"name": family,
 				"family": family,
 				"license": license_type,
 				"license_url": license_url,
-				"designer": items[0].get("font-creator", ""),
-				"foundry": items[0].get("font-foundry", ""),
-				"version": str(items[0].get("info-version", "")),
-				"description": items[0].get("info-about", ""),
+				"designer": first.get("font-creator", ""),
+				"foundry": first.get("font-foundry", ""),
+				"version": str(first.get("info-version", "")),
+				"description": first.get("info-about", ""),
 				"categories": categories,
 				"tags": [],
 				"popularity": 0,
-				"last_modified": datetime.utcnow().isoformat() + "Z",
-				"metadata_url": items[0].get("font-open-source-link", ""),
-				"source_url": items[0].get("font-found-link", items[0].get("font-open-source-link", "")),
+				"last_modified": now_iso,
+				"metadata_url": first.get("font-open-source-link", ""),
+				"source_url": first.get("font-found-link", first.get("font-open-source-link", "")),
 				"variants": variants,
 				"unicode_ranges": [],
 				"languages": [],
-				"sample_text": items[0].get("settings-text", "The quick brown fox jumps over the lazy dog"),
+				"sample_text": first.get("settings-text", "The quick brown fox jumps over the lazy dog"),
 			}
 
-		source = {
-			"source_info": {
-				"name": "Open Foundry",
-				"description": "Curated open-source fonts from Open Foundry",
-				"url": "https://open-foundry.com",
-				"api_endpoint": self.api_url,
-				"version": "1.0",
-				"last_updated": datetime.utcnow().isoformat() + "Z",
-				"total_fonts": len(fonts),
-			},
-			"fonts": fonts,
-		}
-		return source
+		return self._source_data({
+			"name": "Open Foundry",
+			"description": "Curated open-source fonts from Open Foundry",
+			"url": "https://open-foundry.com",
+			"api_endpoint": self.api_url,
+			"version": "1.0",
+			"last_updated": now_iso,
+		}, fonts)
 
 
 def main() -> int:
-	try:
-		translator = OpenFoundryTranslator()
-		source_data = translator.translate()
-		os.makedirs("sources", exist_ok=True)
-		with open("sources/open-foundry.json", "w", encoding="utf-8") as f:
-			json.dump(source_data, f, indent=2, ensure_ascii=False)
-		print(f"Successfully generated sources/open-foundry.json with {source_data['source_info']['total_fonts']} fonts")
-		return 0
-	except Exception as e:
-		print(f"Error: {e}")
-		return 1
+	return OpenFoundryTranslator().run("sources/open-foundry.json")
 
 
 if __name__ == "__main__":
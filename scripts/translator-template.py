@@ -8,88 +8,89 @@ Copy this file and modify for your specific font source API.
 Required: Update the class name, API endpoints, and data extraction logic.
 """
 
-import json
+import functools
 import os
 import re
-from datetime import datetime
+from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 
 import requests
 
+from _translator_base import BaseTranslator
 
-class YourSourceTranslator:
+# Font ID cleaning: each run of disallowed characters (hyphens included) becomes one hyphen
+_ID_RE = re.compile(r"[^a-z0-9]+")
+
+# 10-category mapping with intelligent fallback
+_CATEGORY_MAPPING = MappingProxyType({
+    # Core 10 categories
+    "Sans Serif": "Sans Serif",
+    "Serif": "Serif", 
+    "Slab Serif": "Slab Serif",
+    "Display": "Display",
+    "Monospace": "Monospace",
+    "Script": "Script",
+    "Handwriting": "Handwriting",
+    "Decorative": "Decorative",
+    "Symbol": "Symbol",
+    "Blackletter": "Blackletter",
+
+    # Additional re-mappings to core 10 categories
+    "Typewriter": "Display",           # Typewriter → Display
+    "Novelty": "Decorative",           # Novelty → Decorative
+    "Comic": "Decorative",             # Comic → Decorative
+    "Dingbat": "Symbol",               # Dingbat → Symbol
+    "Handdrawn": "Handwriting",        # Handdrawn → Handwriting
+    "Calligraphic": "Script",          # Calligraphic → Script
+    "Cursive": "Script",               # Cursive → Script
+    "Programming": "Monospace",        # Programming → Monospace
+    "Retro": "Decorative",             # Retro → Decorative
+    "Grunge": "Decorative",            # Grunge → Decorative
+    "Pixel": "Decorative",             # Pixel → Decorative
+    "Stencil": "Decorative",           # Stencil → Decorative
+    "Monospaced": "Monospace",         # Monospaced → Monospace
+
+    # Add source-specific mappings here
+    # "Your Source Category": "Mapped Category",
+})
+_CATEGORY_MAPPING_LOWER = MappingProxyType({key.lower(): value for key, value in _CATEGORY_MAPPING.items()})
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_category(category: str) -> str:
+    """Normalize category with comprehensive enum mapping and fallback."""
+    if not category or not category.strip():
+        return "Other"
+    
+    # First normalize: replace hyphens/underscores with spaces
+    words = category.replace("-", " ").replace("_", " ").split()
+    
+    # Case-insensitive lookup; exact matches resolve to the same value
+    mapped = _CATEGORY_MAPPING_LOWER.get(" ".join(words).lower())
+    if mapped:
+        return mapped
+    
+    # Fallback: return title case for unknown categories
+    # This allows custom sources to add new categories like "Graffiti", "Halloween", etc.
+    return " ".join(word.capitalize() for word in words)
+
+
+class YourSourceTranslator(BaseTranslator):
     def __init__(self, api_key: Optional[str] = None):
         """Initialize translator with API key if needed."""
         self.api_key = api_key or os.getenv("YOUR_API_KEY")
         self.base_url = "https://your-api-endpoint.com/api"
+        # Timestamp of the current translate() run, shared by every font it emits
+        self._now_iso: Optional[str] = None
         
         # Add any required validation
         if not self.api_key:
             raise ValueError("API key is required. Set YOUR_API_KEY environment variable.")
     
-    def _normalize_category(self, category: str) -> str:
-        """Normalize category with comprehensive enum mapping and fallback."""
-        if not category or not category.strip():
-            return "Other"
-        
-        # First normalize: replace hyphens/underscores with spaces, title case
-        cleaned = category.replace("-", " ").replace("_", " ").strip()
-        words = cleaned.split()
-        normalized = " ".join(word.capitalize() for word in words)
-        
-        # 10-category mapping with intelligent fallback
-        category_mapping = {
-            # Core 10 categories
-            "Sans Serif": "Sans Serif",
-            "Serif": "Serif", 
-            "Slab Serif": "Slab Serif",
-            "Display": "Display",
-            "Monospace": "Monospace",
-            "Script": "Script",
-            "Handwriting": "Handwriting",
-            "Decorative": "Decorative",
-            "Symbol": "Symbol",
-            "Blackletter": "Blackletter",
-            
-            # Additional re-mappings to core 10 categories
-            "Typewriter": "Display",           # Typewriter → Display
-            "Novelty": "Decorative",           # Novelty → Decorative
-            "Comic": "Decorative",             # Comic → Decorative
-            "Dingbat": "Symbol",               # Dingbat → Symbol
-            "Handdrawn": "Handwriting",        # Handdrawn → Handwriting
-            "Calligraphic": "Script",          # Calligraphic → Script
-            "Cursive": "Script",               # Cursive → Script
-            "Programming": "Monospace",        # Programming → Monospace
-            "Retro": "Decorative",             # Retro → Decorative
-            "Grunge": "Decorative",            # Grunge → Decorative
-            "Pixel": "Decorative",             # Pixel → Decorative
-            "Stencil": "Decorative",           # Stencil → Decorative
-            "Monospaced": "Monospace",         # Monospaced → Monospace
-            "Cursive": "Script",               # Cursive → Script
-            
-            # Add source-specific mappings here
-            # "Your Source Category": "Mapped Category",
-        }
-        
-        # Check for exact match after normalization
-        if normalized in category_mapping:
-            return category_mapping[normalized]
-        
-        # Check for case-insensitive match
-        normalized_lower = normalized.lower()
-        for key, value in category_mapping.items():
-            if key.lower() == normalized_lower:
-                return value
-        
-        # Fallback: return normalized (title case) for unknown categories
-        # This allows custom sources to add new categories like "Graffiti", "Halloween", etc.
-        return normalized
-    
     def _clean_id(self, value: str) -> str:
         """Clean font ID to match schema requirements."""
-        clean = re.sub(r"[^a-z0-9-]", "-", value.lower())
-        clean = re.sub(r"-+", "-", clean).strip("-")
-        return clean
+        return _ID_RE.sub("-", value.lower()).strip("-")
     
     def _extract_tags(self, font_data: Dict[str, Any]) -> List[str]:
         """Extract all relevant tags from font data."""
@@ -106,8 +107,8 @@ class YourSourceTranslator:
         # if "your_tag_field" in font_data:
         #     tags.append(font_data["your_tag_field"])
         
-        # Remove duplicates and empty tags
-        return list(set(tag.strip() for tag in tags if tag.strip()))
+        # Remove duplicates and empty tags, keeping first-seen order for stable output
+        return list(dict.fromkeys(tag for tag in (tag.strip() for tag in tags) if tag))
     
     def fetch_fonts(self) -> Dict[str, Any]:
         """Fetch all fonts from your source API."""
@@ -135,7 +136,7 @@ class YourSourceTranslator:
             categories = []
             if "category" in font_data:
                 category = font_data["category"]
-                normalized_category = self._normalize_category(category)
+                normalized_category = _normalize_category(category)
                 categories.append(normalized_category)
             
             # Extract variants
@@ -160,7 +161,7 @@ class YourSourceTranslator:
                 "categories": categories,
                 "tags": self._extract_tags(font_data),
                 "popularity": 0,  # TODO: Calculate based on your metrics
-                "last_modified": datetime.utcnow().isoformat() + "Z",
+                "last_modified": self._now_iso or datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
                 "metadata_url": font_data.get("metadata_url", ""),
                 "source_url": font_data.get("source_url", ""),
                 "variants": variants,
@@ -177,6 +178,8 @@ class YourSourceTranslator:
     
     def translate(self) -> Dict[str, Any]:
         """Main translation method."""
+        self._now_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        
         print(f"Fetching fonts from {self.__class__.__name__}...")
         
         # Fetch data from API
@@ -196,43 +199,21 @@ class YourSourceTranslator:
         
         print(f"Successfully transformed {len(fonts)} fonts")
         
-        # Build source info
-        source_info = {
+        # Build source info; _source_data adds total_fonts
+        return self._source_data({
             "name": "Your Source Name",  # TODO: Update
             "description": "Description of your font source",  # TODO: Update
             "url": "https://your-source-website.com",  # TODO: Update
             "api_endpoint": self.base_url,
             "version": "1.0",
-            "last_updated": datetime.utcnow().isoformat() + "Z",
-            "total_fonts": len(fonts),
-        }
-        
-        return {
-            "source_info": source_info,
-            "fonts": fonts,
-        }
+            "last_updated": self._now_iso,
+        }, fonts)
 
 
 def main() -> int:
     """Main entry point for the translator."""
-    try:
-        translator = YourSourceTranslator()
-        source_data = translator.translate()
-        
-        # Ensure sources directory exists
-        os.makedirs("sources", exist_ok=True)
-        
-        # Write output file
-        output_file = "sources/your-source.json"  # TODO: Update filename
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(source_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"Successfully generated {output_file} with {source_data['source_info']['total_fonts']} fonts")
-        return 0
-        
-    except Exception as e:
-        print(f"Error: {e}")
-        return 1
+    # Writes the output file (creates sources/; uses orjson when installed)
+    return YourSourceTranslator().run("sources/your-source.json")  # TODO: Update filename
 
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+"""Tests for scripts/google-fonts-translator.py."""
+
+import contextlib
+import importlib.util
+import io
+import sys
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# The script name is hyphenated, so load it from its path
+_spec = importlib.util.spec_from_file_location("google_fonts_translator", SCRIPTS_DIR / "google-fonts-translator.py")
+google_fonts_translator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(google_fonts_translator)
+
+
+def _font(family, **fields):
+    font_data = {
+        "family": family,
+        "category": "sans-serif",
+        "variants": ["regular", "700italic"],
+        "files": {"regular": "https://fonts.gstatic.com/a.ttf", "700italic": "https://fonts.gstatic.com/b.ttf"},
+        "subsets": ["latin"],
+    }
+    font_data.update(fields)
+    return font_data
+
+
+class TranslateMalformedEntriesTest(unittest.TestCase):
+    def _translate(self, items):
+        translator = google_fonts_translator.GoogleFontsTranslator(api_key="test")
+        translator.fetch_fonts = lambda: {"items": items}
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            source_data = translator.translate()
+        return source_data, output.getvalue()
+
+    def test_malformed_entries_are_skipped_and_counted(self):
+        items = [
+            _font("Good Sans"),
+            _font("Bad Category", category=None),
+            _font("Bad Variants", variants="regular"),
+            _font("Bad Files", files=["https://fonts.gstatic.com/a.ttf"]),
+            _font("Bad Subsets", subsets=[{"latin": True}]),
+            {"category": "serif"},
+        ]
+
+        source_data, output = self._translate(items)
+
+        self.assertEqual(list(source_data["fonts"]), ["good-sans"])
+        self.assertEqual(source_data["source_info"]["total_fonts"], 1)
+        self.assertIn("Skipped 5 malformed fonts", output)
+
+    def test_non_decimal_digit_variants_are_skipped(self):
+        # "²".isdigit() is True but int("²") raises, so these must not reach int()
+        items = [_font("Superscript", variants=["regular", "²", "²italic"], files={"regular": "https://fonts.gstatic.com/a.ttf"})]
+
+        source_data, output = self._translate(items)
+
+        variants = source_data["fonts"]["superscript"]["variants"]
+        self.assertEqual([(variant["weight"], variant["style"]) for variant in variants], [(400, "normal")])
+        self.assertNotIn("bold", source_data["fonts"]["superscript"]["tags"])
+        self.assertNotIn("Skipped", output)
+
+    def test_optional_fields_may_be_absent(self):
+        source_data, output = self._translate([{"family": "Bare"}])
+
+        self.assertEqual(source_data["fonts"]["bare"]["variants"], [])
+        self.assertNotIn("Skipped", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
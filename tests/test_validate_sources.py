@@ -0,0 +1,73 @@
+"""Tests for schemas/validate-sources.py."""
+
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+SCHEMAS_DIR = Path(__file__).resolve().parent.parent / "schemas"
+
+# The script name is hyphenated, so load it from its path
+_spec = importlib.util.spec_from_file_location("validate_sources", SCHEMAS_DIR / "validate-sources.py")
+validate_sources = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(validate_sources)
+
+# A missing required property and a mistyped nested value, so errors have both empty and nested paths
+INVALID_SOURCE = {
+    "source_info": {"name": "Broken", "total_fonts": "two"},
+    "fonts": {"broken-font": {"name": "Broken Font", "variants": [{"weight": "bold"}]}},
+}
+
+
+def _draft7_messages(data):
+    """Errors as the jsonschema-only baseline formatted them."""
+    schema = json.loads((SCHEMAS_DIR / "font-source-schema.json").read_text(encoding="utf-8"))
+    return [
+        f"{' -> '.join(str(p) for p in error.absolute_path)}: {error.message}"
+        for error in validate_sources.jsonschema.Draft7Validator(schema).iter_errors(data)
+    ]
+
+
+class ValidateFileMessagesTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.validator = validate_sources.SourceValidator(check_warnings=False)
+
+    def _write(self, name, content):
+        path = Path(self.tmp_dir.name) / name
+        path.write_bytes(content)
+        return str(path)
+
+    @unittest.skipIf(validate_sources.jsonschema is None, "jsonschema not installed")
+    def test_schema_errors_match_draft7_on_either_backend(self):
+        path = self._write("invalid.json", json.dumps(INVALID_SOURCE).encode())
+
+        result = self.validator.validate_file(path)
+
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["errors"], _draft7_messages(INVALID_SOURCE))
+        self.assertTrue(any(" -> " in error for error in result["errors"]))
+
+    @unittest.skipIf(validate_sources.jsonschema_rs is None, "jsonschema_rs not installed")
+    def test_rust_error_paths_format_like_draft7(self):
+        schema = self.validator.schema
+        rust_errors = validate_sources.jsonschema_rs.validator_for(schema, validate_formats=False).iter_errors(INVALID_SOURCE)
+        rust_paths = sorted(self.validator._format_error(error).split(": ", 1)[0] for error in rust_errors)
+        draft7_paths = sorted(message.split(": ", 1)[0] for message in _draft7_messages(INVALID_SOURCE))
+
+        self.assertEqual(rust_paths, draft7_paths)
+
+    def test_syntax_errors_use_json_module_messages(self):
+        path = self._write("truncated.json", b'{"fonts": ')
+        with self.assertRaises(json.JSONDecodeError) as raised:
+            json.loads('{"fonts": ')
+
+        result = self.validator.validate_file(path)
+
+        self.assertEqual(result["errors"], [f"JSON syntax error: {raised.exception}"])
+
+
+if __name__ == "__main__":
+    unittest.main()